@@ -59,46 +59,61 @@ if file_path is None:
 
 irf = RunFolder.from_file_path(file_path=file_path)
 
-if not irf.run_parameters.get_experiment_name:
+# The RunParameters properties search the XML tree upon each access, so look them up only once.
+
+run_parameters = irf.run_parameters
+run_information = irf.run_information
+
+experiment_name = run_parameters.get_experiment_name
+if not experiment_name:
     raise Exception("No experiment name set in the Illumina Run Folder configuration.")
 
-print('Flow Cell Identifier: ', '_'.join((irf.run_parameters.get_experiment_name,
-                                          irf.run_parameters.get_flow_cell_barcode)))
-print('Read Structure:       ', ' + '.join(irf.run_information.get_read_structure_list))
+flow_cell_barcode = run_parameters.get_flow_cell_barcode
+
+print('Flow Cell Identifier: ', '_'.join((experiment_name, flow_cell_barcode)))
+print('Read Structure:       ', ' + '.join(run_information.get_read_structure_list))
+
+# Use a single os.stat() call per file path, rather than os.path.exists() followed by os.stat().
 
-file_path_start = os.path.join(file_path, 'Config')
-if os.path.exists(file_path_start):
-    print('Start date:           ', datetime.date.fromtimestamp(os.stat(file_path_start).st_mtime))
+try:
+    stat_result = os.stat(os.path.join(file_path, 'Config'))
+except OSError:
+    pass
+else:
+    print('Start date:           ', datetime.date.fromtimestamp(stat_result.st_mtime))
 
-file_path_end = os.path.join(file_path, 'RTAComplete.txt')
-if os.path.exists(file_path_end):
-    print('End date:             ', datetime.date.fromtimestamp(os.stat(file_path_end).st_mtime))
+try:
+    stat_result = os.stat(os.path.join(file_path, 'RTAComplete.txt'))
+except OSError:
+    pass
+else:
+    print('End date:             ', datetime.date.fromtimestamp(stat_result.st_mtime))
 
-print('Experiment:           ', irf.run_parameters.get_experiment_name)
-print('Flow Cell:            ', irf.run_parameters.get_flow_cell_barcode)
+print('Experiment:           ', experiment_name)
+print('Flow Cell:            ', flow_cell_barcode)
 
-position = irf.run_parameters.get_position
+position = run_parameters.get_position
 if position:
-    print('Position:             ', irf.run_parameters.get_position)
+    print('Position:             ', position)
 
-print('Run Identifier:       ', irf.run_information.run_identifier)
-print('Application Name:     ', irf.run_parameters.get_application_name)
-print('Application Version:  ', irf.run_parameters.get_application_version)
-print('RTA Version:          ', irf.run_parameters.get_real_time_analysis_version)
+print('Run Identifier:       ', run_information.run_identifier)
+print('Application Name:     ', run_parameters.get_application_name)
+print('Application Version:  ', run_parameters.get_application_version)
+print('RTA Version:          ', run_parameters.get_real_time_analysis_version)
 
-flow_cell_type = irf.run_parameters.get_flow_cell_type
+flow_cell_type = run_parameters.get_flow_cell_type
 if flow_cell_type:
     print('Flow Cell Type:       ', flow_cell_type)
 
-index_type = irf.run_parameters.get_index_type
+index_type = run_parameters.get_index_type
 if index_type:
     print('Index Type:           ', index_type)
 
-pe_type = irf.run_parameters.get_pe_type
+pe_type = run_parameters.get_pe_type
 if pe_type:
     print('Paired-end Type:      ', pe_type)
 
-sbs_type = irf.run_parameters.get_sbs_type
+sbs_type = run_parameters.get_sbs_type
 if sbs_type:
     print('SBS Type:             ', sbs_type)
 
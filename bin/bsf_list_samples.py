@@ -28,13 +28,53 @@
 # along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
 #
 import os
-import re
 from argparse import ArgumentParser
-from csv import DictWriter
+from csv import writer
 
 from bsf.ngs import ProcessedRunFolder
 from bsf.standards import Configuration, StandardFilePath
 
+
+def get_row_tuples(processed_run_folder, full=False):
+    """Generate Python C{tuple} objects of Python C{str} objects in the order of the CSV fields.
+
+    @param processed_run_folder: C{bsf.ngs.ProcessedRunFolder}
+    @type processed_run_folder: ProcessedRunFolder
+    @param full: Full listing with file paths
+    @type full: bool
+    @return: Python C{tuple} of Python C{str} objects
+    @rtype: collections.Iterable[tuple[str]]
+    """
+    for project_name, project in sorted(processed_run_folder.project_dict.items()):
+        for sample_name, sample in sorted(project.sample_dict.items()):
+
+            if full:
+                for paired_reads in sample.paired_reads_list:
+                    if paired_reads.reads_1 is not None:
+                        file_path_1 = paired_reads.reads_1.file_path
+                        # Deduce the Reads.name from the base name without file extensions.
+                        # Remove any file-extensions like .bam, .fastq.gz, ...
+                        file_name_1 = os.path.basename(file_path_1).split('.', 1)[0]
+                    else:
+                        file_path_1 = str()
+                        file_name_1 = str()
+                    if paired_reads.reads_2 is not None:
+                        file_path_2 = paired_reads.reads_2.file_path
+                        # Deduce the Reads.name from the base name without file extensions.
+                        # Remove any file-extensions like .bam, .fastq.gz, ...
+                        file_name_2 = os.path.basename(file_path_2).split('.', 1)[0]
+                    else:
+                        file_path_2 = str()
+                        file_name_2 = str()
+                    # A line for each PairedReads replicate.
+                    yield (
+                        processed_run_folder.name, project.name, sample.name,
+                        file_path_1, file_name_1, file_path_2, file_name_2)
+            else:
+                # A line for each Sample, containing PairedReads replicates.
+                yield processed_run_folder.name, project.name, sample.name
+
+
 argument_parser = ArgumentParser(description='List projects and samples.')
 
 # Only a --full flag, with out a value.
@@ -61,20 +101,21 @@ argument_parser.add_argument(
 
 name_space = argument_parser.parse_args()
 
-# Open the output file, create a csv.DictWriter and write a header line.
+# Open the output file, create a csv.writer and write a header line.
 
 # For Python2.7, the open() function has to use the binary 'b' flag.
 # For Python3, the open() function has to use newline=''.
-csv_file = open(file=name_space.output_file, mode='w', newline='')
+# Use a 1 MiB buffer to coalesce the many small writes of the csv.writer.
+csv_file = open(file=name_space.output_file, mode='w', buffering=1 << 20, newline='')
 
 csv_fields = ['ProcessedRunFolder', 'Project', 'Sample']
 
 if name_space.full:
     csv_fields.extend(['File1', 'Reads1', 'File2', 'Reads2'])
 
-csv_writer = DictWriter(f=csv_file, fieldnames=csv_fields)
+csv_writer = writer(csv_file)
 
-csv_writer.writeheader()
+csv_writer.writerow(csv_fields)
 
 # Assemble the input directory.
 
@@ -83,45 +124,9 @@ input_directory = Configuration.get_absolute_path(
     default_path=StandardFilePath.get_sequences(absolute=True))
 
 prf = ProcessedRunFolder.from_file_path(file_path=input_directory, file_type='Automatic')
-for project_name in sorted(prf.project_dict):
-    project = prf.project_dict[project_name]
-    for sample_name in sorted(project.sample_dict):
-        sample = project.sample_dict[sample_name]
-
-        row_dict = {'ProcessedRunFolder': prf.name, 'Project': project.name, 'Sample': sample.name}
-
-        if name_space.full:
-            for paired_reads in sample.paired_reads_list:
-                if paired_reads.reads_1 is not None:
-                    row_dict['File1'] = paired_reads.reads_1.file_path
-                    # row_dict['Reads1'] = paired_reads.reads1.name
-                    # Deduce the Reads.name from the base name without file extensions.
-                    file_name = os.path.basename(paired_reads.reads_1.file_path.rstrip('/ '))
-                    # Remove any file-extensions like .bam, .fastq.gz, ...
-                    match = re.search(pattern=r'^([^.]*)', string=file_name)
-                    if match:
-                        file_name = match.group(1)
-                    row_dict['Reads1'] = file_name
-                else:
-                    row_dict['File1'] = str()
-                    row_dict['Reads1'] = str()
-                if paired_reads.reads_2 is not None:
-                    row_dict['File2'] = paired_reads.reads_2.file_path
-                    # row_dict['Reads2'] = paired_reads.reads2.name
-                    # Deduce the Reads.name from the base name without file extensions.
-                    file_name = os.path.basename(paired_reads.reads_2.file_path.rstrip('/ '))
-                    # Remove any file-extensions like .bam, .fastq.gz, ...
-                    match = re.search(pattern=r'^([^.]*)', string=file_name)
-                    if match:
-                        file_name = match.group(1)
-                    row_dict['Reads2'] = file_name
-                else:
-                    row_dict['File2'] = str()
-                    row_dict['Reads2'] = str()
-                # A line for each PairedReads replicate.
-                csv_writer.writerow(rowdict=row_dict)
-        else:
-            # A line for each Sample, containing PairedReads replicates.
-            csv_writer.writerow(rowdict=row_dict)
+
+# Stream the row tuples straight into the csv.writer.
+
+csv_writer.writerows(get_row_tuples(processed_run_folder=prf, full=name_space.full))
 
 csv_file.close()
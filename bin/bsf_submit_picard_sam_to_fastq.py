@@ -120,12 +120,20 @@ else:
     analysis.check_state()
     analysis.submit(name=name_space.stage)
 
-    print(analysis.name)
-    print('Project name:      ', analysis.project_name)
-    print('Input directory:   ', analysis.input_directory)
-    print('Output directory:  ', analysis.output_directory)
-    print('Project directory: ', analysis.project_directory)
-    print('Genome directory:  ', analysis.genome_directory)
+    # Write the summary in a single call to avoid a write system call per line on line-buffered output.
+    sys.stdout.write(
+        '{}\n'
+        'Project name:       {}\n'
+        'Input directory:    {}\n'
+        'Output directory:   {}\n'
+        'Project directory:  {}\n'
+        'Genome directory:   {}\n'.format(
+            analysis.name,
+            analysis.project_name,
+            analysis.input_directory,
+            analysis.output_directory,
+            analysis.project_directory,
+            analysis.genome_directory))
 
 if analysis.debug >= 2:
     print(repr(analysis), 'final trace:')
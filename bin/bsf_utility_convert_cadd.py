@@ -28,7 +28,6 @@
 # along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
 #
 import os
-import sys
 from argparse import ArgumentParser
 from subprocess import Popen, PIPE
 
@@ -46,7 +45,6 @@ def process_stdout(input_file_handle, thread_lock, debug, output_file_path):
         stdout=output_file,
         stderr=None,
         shell=False,
-        close_fds='posix' in sys.builtin_module_names,
         text=True)
     thread_lock.release()
 
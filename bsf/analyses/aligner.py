@@ -740,24 +740,23 @@ class Aligner(Analysis):
                 # Skip Sample objects, which PairedReads objects have all been excluded.
                 continue
 
-            for paired_reads_name in sorted(paired_reads_dict):
-                if not paired_reads_dict[paired_reads_name]:
+            for paired_reads_name, paired_reads_list in sorted(paired_reads_dict.items()):
+                if not paired_reads_list:
                     # Skip replicate keys, which PairedReads objects have all been excluded.
                     continue
 
-                if len(paired_reads_dict[paired_reads_name]) > 1:
+                if len(paired_reads_list) > 1:
                     raise Exception('Cannot align and process more than one PairedReads object at a time.')
 
                 # Record the Runnable for the Picard MergeBamAlignment step.
-                paired_reads = paired_reads_dict[paired_reads_name][0]
+                paired_reads = paired_reads_list[0]
 
                 # Get the file paths for Reads1 and Reads2 and check for FASTQ files.
                 if paired_reads.reads_1 is None:
                     raise Exception('A ' + self.name + ' requires a Reads1 object.')
                 else:
                     if paired_reads.reads_1.file_path is not None:
-                        if not (paired_reads.reads_1.file_path.endswith('.fastq') or
-                                paired_reads.reads_1.file_path.endswith('.fastq.gz')):
+                        if not paired_reads.reads_1.file_path.endswith(('.fastq', '.fastq.gz')):
                             raise Exception('A ' + self.name + ' requires a (GNU Zip compressed) FASTQ file.')
                     file_path_1 = paired_reads.reads_1.file_path
 
@@ -765,8 +764,7 @@ class Aligner(Analysis):
                     file_path_2 = None
                 else:
                     if paired_reads.reads_2.file_path is not None:
-                        if not (paired_reads.reads_2.file_path.endswith('.fastq') or
-                                paired_reads.reads_2.file_path.endswith('.fastq.gz')):
+                        if not paired_reads.reads_2.file_path.endswith(('.fastq', '.fastq.gz')):
                             raise Exception('A ' + self.name + ' requires a (GNU Zip compressed) FASTQ file.')
                     file_path_2 = paired_reads.reads_2.file_path
 
@@ -841,6 +839,8 @@ class Aligner(Analysis):
                 # QUIET [false]
                 # VALIDATION_STRINGENCY [STRICT]
                 # COMPRESSION_LEVEL [5]
+                # The aligned BAM file is an intermediate file, which only needs fast compression.
+                runnable_step.add_picard_option(key='COMPRESSION_LEVEL', value='1')
                 # MAX_RECORDS_IN_RAM [500000]
                 runnable_step.add_picard_option(key='MAX_RECORDS_IN_RAM', value='2000000')
                 # CREATE_INDEX [false]
@@ -983,6 +983,8 @@ class Aligner(Analysis):
                     # QUIET [false]
                     # VALIDATION_STRINGENCY [STRICT]
                     # COMPRESSION_LEVEL [5]
+                    # The merged BAM file is an intermediate file, which only needs fast compression.
+                    runnable_step.add_picard_option(key='COMPRESSION_LEVEL', value='1')
                     # MAX_RECORDS_IN_RAM [500000]
                     runnable_step.add_picard_option(key='MAX_RECORDS_IN_RAM', value='2000000')
                     # CREATE_INDEX [false]
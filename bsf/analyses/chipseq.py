@@ -25,6 +25,7 @@ A package of classes and methods supporting ChIP-Seq analyses.
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
 #
+import itertools
 import os
 import sys
 import warnings
@@ -69,6 +70,10 @@ class ChIPSeqComparison(object):
     @type diff_bind: bool
     """
 
+    __slots__ = (
+        'name', 'group', 'c_name', 't_name', 'c_samples', 't_samples', 'factor', 'tissue', 'condition', 'treatment',
+        'replicate', 'diff_bind')
+
     def __init__(
             self,
             name,
@@ -211,6 +216,10 @@ class FilePathAlignment(FilePath):
     @type coverage_bwi_txt: str
     """
 
+    __slots__ = (
+        'output_directory', 'sample_bam', 'sample_bai', 'sample_md5', 'filter_metrics_tsv', 'coverage_bw',
+        'coverage_bwi_txt')
+
     def __init__(self, prefix):
         """Initialise a C{bsf.analyses.chipseq.FilePathAlignment} object
 
@@ -306,6 +315,14 @@ class FilePathPeakCalling(FilePath):
     @type model_1_png: str
     """
 
+    __slots__ = (
+        'output_directory', 'name_prefix', 'control_bdg', 'control_bw', 'control_bwi', 'treatment_bdg', 'treatment_bw',
+        'treatment_bwi', 'comparison_log_fe_bdg', 'comparison_log_fe_bw', 'comparison_log_fe_bwi',
+        'comparison_ppois_bdg', 'comparison_ppois_bw', 'comparison_ppois_bwi', 'comparison_subtract_bdg',
+        'comparison_subtract_bw', 'comparison_subtract_bwi', 'peaks_narrow', 'narrow_peaks_bed', 'narrow_peaks_bb',
+        'narrow_peaks_bbi', 'summits_bed', 'summits_bb', 'summits_bbi', 'peaks_tsv', 'peaks_xls', 'model_r',
+        'model_pdf', 'model_0_png', 'model_1_png')
+
     def __init__(self, prefix):
         """Initialise a C{bsf.analyses.chipseq.FilePathPeakCalling} object
 
@@ -317,48 +334,53 @@ class FilePathPeakCalling(FilePath):
         self.output_directory = prefix
         self.name_prefix = os.path.join(prefix, prefix)  # MACS2 --name option
 
-        self.control_bdg = os.path.join(prefix, '_'.join((prefix, 'control_lambda.bdg')))
-        self.control_bw = os.path.join(prefix, '_'.join((prefix, 'control_lambda.bw')))
-        self.control_bwi = os.path.join(prefix, '_'.join((prefix, 'control_lambda_bwi.txt')))
+        # Join the directory and file name prefix once for all file paths below.
+        path_prefix = self.name_prefix + '_'
+
+        self.control_bdg = path_prefix + 'control_lambda.bdg'
+        self.control_bw = path_prefix + 'control_lambda.bw'
+        self.control_bwi = path_prefix + 'control_lambda_bwi.txt'
 
-        self.treatment_bdg = os.path.join(prefix, '_'.join((prefix, 'treat_pileup.bdg')))
-        self.treatment_bw = os.path.join(prefix, '_'.join((prefix, 'treat_pileup.bw')))
-        self.treatment_bwi = os.path.join(prefix, '_'.join((prefix, 'treat_pileup_bwi.txt')))
+        self.treatment_bdg = path_prefix + 'treat_pileup.bdg'
+        self.treatment_bw = path_prefix + 'treat_pileup.bw'
+        self.treatment_bwi = path_prefix + 'treat_pileup_bwi.txt'
 
-        self.comparison_log_fe_bdg = os.path.join(prefix, '_'.join((prefix, 'logFE.bdg')))
-        self.comparison_log_fe_bw = os.path.join(prefix, '_'.join((prefix, 'logFE.bw')))
-        self.comparison_log_fe_bwi = os.path.join(prefix, '_'.join((prefix, 'logFE_bwi.txt')))
+        self.comparison_log_fe_bdg = path_prefix + 'logFE.bdg'
+        self.comparison_log_fe_bw = path_prefix + 'logFE.bw'
+        self.comparison_log_fe_bwi = path_prefix + 'logFE_bwi.txt'
 
-        self.comparison_ppois_bdg = os.path.join(prefix, '_'.join((prefix, 'ppois.bdg')))
-        self.comparison_ppois_bw = os.path.join(prefix, '_'.join((prefix, 'ppois.bw')))
-        self.comparison_ppois_bwi = os.path.join(prefix, '_'.join((prefix, 'ppois_bwi.txt')))
+        self.comparison_ppois_bdg = path_prefix + 'ppois.bdg'
+        self.comparison_ppois_bw = path_prefix + 'ppois.bw'
+        self.comparison_ppois_bwi = path_prefix + 'ppois_bwi.txt'
 
-        self.comparison_subtract_bdg = os.path.join(prefix, '_'.join((prefix, 'subtract.bdg')))
-        self.comparison_subtract_bw = os.path.join(prefix, '_'.join((prefix, 'subtract.bw')))
-        self.comparison_subtract_bwi = os.path.join(prefix, '_'.join((prefix, 'subtract_bwi.txt')))
+        self.comparison_subtract_bdg = path_prefix + 'subtract.bdg'
+        self.comparison_subtract_bw = path_prefix + 'subtract.bw'
+        self.comparison_subtract_bwi = path_prefix + 'subtract_bwi.txt'
 
-        self.peaks_narrow = os.path.join(prefix, '_'.join((prefix, 'peaks.narrowPeak')))
+        self.peaks_narrow = path_prefix + 'peaks.narrowPeak'
 
-        self.narrow_peaks_bed = os.path.join(prefix, '_'.join((prefix, 'narrow_peaks.bed')))
-        self.narrow_peaks_bb = os.path.join(prefix, '_'.join((prefix, 'narrow_peaks.bb')))
-        self.narrow_peaks_bbi = os.path.join(prefix, '_'.join((prefix, 'narrow_peaks_bbi.txt')))
+        self.narrow_peaks_bed = path_prefix + 'narrow_peaks.bed'
+        self.narrow_peaks_bb = path_prefix + 'narrow_peaks.bb'
+        self.narrow_peaks_bbi = path_prefix + 'narrow_peaks_bbi.txt'
 
-        self.summits_bed = os.path.join(prefix, '_'.join((prefix, 'summits.bed')))
-        self.summits_bb = os.path.join(prefix, '_'.join((prefix, 'summits.bb')))
-        self.summits_bbi = os.path.join(prefix, '_'.join((prefix, 'summits_bbi.txt')))
+        self.summits_bed = path_prefix + 'summits.bed'
+        self.summits_bb = path_prefix + 'summits.bb'
+        self.summits_bbi = path_prefix + 'summits_bbi.txt'
 
-        self.peaks_tsv = os.path.join(prefix, '_'.join((prefix, 'peaks.tsv')))
-        self.peaks_xls = os.path.join(prefix, '_'.join((prefix, 'peaks.xls')))
+        self.peaks_tsv = path_prefix + 'peaks.tsv'
+        self.peaks_xls = path_prefix + 'peaks.xls'
 
-        self.model_r = os.path.join(prefix, '_'.join((prefix, 'model.r')))
-        self.model_pdf = os.path.join(prefix, '_'.join((prefix, 'model.pdf')))
-        self.model_0_png = os.path.join(prefix, '_'.join((prefix, 'model-0.png')))
-        self.model_1_png = os.path.join(prefix, '_'.join((prefix, 'model-1.png')))
+        self.model_r = path_prefix + 'model.r'
+        self.model_pdf = path_prefix + 'model.pdf'
+        self.model_0_png = path_prefix + 'model-0.png'
+        self.model_1_png = path_prefix + 'model-1.png'
 
         return
 
 
 class FilePathChIPQC(FilePath):
+    __slots__ = ('output_directory', 'report_html')
+
     def __init__(self, prefix):
         """Initialise a C{bsf.analyses.chipseq.FilePathChIPQC} object
 
@@ -375,6 +397,12 @@ class FilePathChIPQC(FilePath):
 
 
 class FilePathDiffBind(FilePath):
+    __slots__ = (
+        'output_directory', 'sample_annotation_sheet', 'correlation_read_counts_pdf', 'correlation_read_counts_png',
+        'correlation_peak_caller_score_pdf', 'correlation_peak_caller_score_png', 'correlation_analysis_pdf',
+        'correlation_analysis_png', 'pca_pdf', 'pca_png', 'contrasts_csv', 'genes_complete_tsv', 'regions_pdf',
+        'regions_png', 'regions_tsv')
+
     def __init__(self, prefix):
         """Initialise a C{bsf.analyses.chipseq.FilePathDiffBind} object
 
@@ -385,24 +413,32 @@ class FilePathDiffBind(FilePath):
 
         self.output_directory = prefix
         self.sample_annotation_sheet = prefix + '_samples.csv'
-        self.correlation_read_counts_pdf = os.path.join(prefix, prefix + '_correlation_read_counts.pdf')
-        self.correlation_read_counts_png = os.path.join(prefix, prefix + '_correlation_read_counts.png')
-        self.correlation_peak_caller_score_pdf = os.path.join(prefix, prefix + '_correlation_peak_caller_score.pdf')
-        self.correlation_peak_caller_score_png = os.path.join(prefix, prefix + '_correlation_peak_caller_score.png')
-        self.correlation_analysis_pdf = os.path.join(prefix, prefix + '_correlation_analysis.pdf')
-        self.correlation_analysis_png = os.path.join(prefix, prefix + '_correlation_analysis.png')
-        self.pca_pdf = os.path.join(prefix, prefix + '_pca_plot.pdf')
-        self.pca_png = os.path.join(prefix, prefix + '_pca_plot.png')
-        self.contrasts_csv = os.path.join(prefix, prefix + '_contrasts.csv')
-        self.genes_complete_tsv = os.path.join(prefix, prefix + '_peak_set_genes_complete.tsv')
-        self.regions_pdf = os.path.join(prefix, prefix + '_peak_set_regions.pdf')
-        self.regions_png = os.path.join(prefix, prefix + '_peak_set_regions.png')
-        self.regions_tsv = os.path.join(prefix, prefix + '_peak_set_regions.tsv')
+
+        path_prefix = os.path.join(prefix, prefix + '_')
+
+        self.correlation_read_counts_pdf = path_prefix + 'correlation_read_counts.pdf'
+        self.correlation_read_counts_png = path_prefix + 'correlation_read_counts.png'
+        self.correlation_peak_caller_score_pdf = path_prefix + 'correlation_peak_caller_score.pdf'
+        self.correlation_peak_caller_score_png = path_prefix + 'correlation_peak_caller_score.png'
+        self.correlation_analysis_pdf = path_prefix + 'correlation_analysis.pdf'
+        self.correlation_analysis_png = path_prefix + 'correlation_analysis.png'
+        self.pca_pdf = path_prefix + 'pca_plot.pdf'
+        self.pca_png = path_prefix + 'pca_plot.png'
+        self.contrasts_csv = path_prefix + 'contrasts.csv'
+        self.genes_complete_tsv = path_prefix + 'peak_set_genes_complete.tsv'
+        self.regions_pdf = path_prefix + 'peak_set_regions.pdf'
+        self.regions_png = path_prefix + 'peak_set_regions.png'
+        self.regions_tsv = path_prefix + 'peak_set_regions.tsv'
 
         return
 
 
 class FilePathDiffBindContrast(FilePath):
+    __slots__ = (
+        'ma_plot_pdf', 'ma_plot_png', 'scatter_plot_pdf', 'scatter_plot_png', 'pca_plot_pdf', 'pca_plot_png',
+        'box_plot_pdf', 'box_plot_png', 'peaks_tsv', 'genes_complete_tsv', 'genes_significant_tsv', 'regions_pdf',
+        'regions_png', 'regions_tsv')
+
     def __init__(self, prefix, group_1, group_2):
         """Initialise a C{bsf.analyses.chipseq.FilePathDiffBind} object
 
@@ -417,20 +453,22 @@ class FilePathDiffBindContrast(FilePath):
 
         suffix = group_1 + '__' + group_2
 
-        self.ma_plot_pdf = os.path.join(prefix, prefix + '_ma_plot_' + suffix + '.pdf')
-        self.ma_plot_png = os.path.join(prefix, prefix + '_ma_plot_' + suffix + '.png')
-        self.scatter_plot_pdf = os.path.join(prefix, prefix + '_scatter_plot_' + suffix + '.pdf')
-        self.scatter_plot_png = os.path.join(prefix, prefix + '_scatter_plot_' + suffix + '.png')
-        self.pca_plot_pdf = os.path.join(prefix, prefix + '_pca_plot_' + suffix + '.pdf')
-        self.pca_plot_png = os.path.join(prefix, prefix + '_pca_plot_' + suffix + '.png')
-        self.box_plot_pdf = os.path.join(prefix, prefix + '_box_plot_' + suffix + '.pdf')
-        self.box_plot_png = os.path.join(prefix, prefix + '_box_plot_' + suffix + '.png')
-        self.peaks_tsv = os.path.join(prefix, prefix + '_peaks_' + suffix + '.tsv')
-        self.genes_complete_tsv = os.path.join(prefix, prefix + '_peaks_' + suffix + '_genes_complete.tsv')
-        self.genes_significant_tsv = os.path.join(prefix, prefix + '_peaks_' + suffix + '_genes_significant.tsv')
-        self.regions_pdf = os.path.join(prefix, prefix + '_peaks_' + suffix + '_regions.pdf')
-        self.regions_png = os.path.join(prefix, prefix + '_peaks_' + suffix + '_regions.png')
-        self.regions_tsv = os.path.join(prefix, prefix + '_peaks_' + suffix + '_regions.tsv')
+        path_prefix = os.path.join(prefix, prefix + '_')
+
+        self.ma_plot_pdf = path_prefix + 'ma_plot_' + suffix + '.pdf'
+        self.ma_plot_png = path_prefix + 'ma_plot_' + suffix + '.png'
+        self.scatter_plot_pdf = path_prefix + 'scatter_plot_' + suffix + '.pdf'
+        self.scatter_plot_png = path_prefix + 'scatter_plot_' + suffix + '.png'
+        self.pca_plot_pdf = path_prefix + 'pca_plot_' + suffix + '.pdf'
+        self.pca_plot_png = path_prefix + 'pca_plot_' + suffix + '.png'
+        self.box_plot_pdf = path_prefix + 'box_plot_' + suffix + '.pdf'
+        self.box_plot_png = path_prefix + 'box_plot_' + suffix + '.png'
+        self.peaks_tsv = path_prefix + 'peaks_' + suffix + '.tsv'
+        self.genes_complete_tsv = path_prefix + 'peaks_' + suffix + '_genes_complete.tsv'
+        self.genes_significant_tsv = path_prefix + 'peaks_' + suffix + '_genes_significant.tsv'
+        self.regions_pdf = path_prefix + 'peaks_' + suffix + '_regions.pdf'
+        self.regions_png = path_prefix + 'peaks_' + suffix + '_regions.png'
+        self.regions_tsv = path_prefix + 'peaks_' + suffix + '_regions.tsv'
 
         return
 
@@ -506,12 +544,12 @@ class ChIPSeqDiffBindSheet(AnnotationSheet):
         """Sort by columns I{Tissue}, I{Factor}, I{Condition}, I{Treatment} and I{Replicate}.
         """
         self.row_dicts.sort(
-            key=lambda item: '_'.join((
+            key=lambda item: (
                 item['Tissue'],
                 item['Factor'],
                 item['Condition'],
                 item['Treatment'],
-                '{:06d}'.format(int(item['Replicate'])))))
+                int(item['Replicate'])))
 
         return
 
@@ -537,6 +575,8 @@ class ChIPSeq(Analysis):
     @type name: str
     @cvar prefix: C{bsf.analysis.Analysis.prefix} that should be overridden by sub-classes
     @type prefix: str
+    @cvar factor_names: Python C{frozenset} of Python C{str} factor names known to the peak callers
+    @type factor_names: frozenset[str]
     @ivar replicate_grouping: Group all replicates into a single Tophat and Cufflinks process
     @type replicate_grouping: bool
     @ivar comparison_path: Comparison file path
@@ -561,11 +601,17 @@ class ChIPSeq(Analysis):
     @type colour_dict: dict[str, str] | None
     @ivar factor_default: Default factor
     @type factor_default: str
+    @ivar macs2_program: MACS2 program name or path (e.g. macs2 or macs3)
+    @type macs2_program: str | None
     """
 
     name = 'ChIP-seq Analysis'
     prefix = 'chipseq'
 
+    factor_names = frozenset((
+        'H3K4ME1', 'H3K4ME2', 'H3K4ME3', 'H3K9AC', 'H3K9ME3', 'H3K27AC', 'H3K27ME1', 'H3K27ME2', 'H3K27ME3',
+        'H3K36ME3', 'H3K56AC', 'H4K16AC', 'OTHER'))
+
     @classmethod
     def get_stage_name_alignment(cls):
         """Get a Python C{str} for a particular C{bsf.analysis.Stage.name}.
@@ -739,7 +785,8 @@ class ChIPSeq(Analysis):
             transcriptome_txdb_path=None,
             colour_default=None,
             colour_dict=None,
-            factor_default=None):
+            factor_default=None,
+            macs2_program=None):
         """Initialise a C{bsf.analyses.chipseq.ChIPSeq}.
 
         @param configuration: C{bsf.standards.Configuration}
@@ -794,6 +841,8 @@ class ChIPSeq(Analysis):
         @type colour_dict: dict[str, str] | None
         @param factor_default: Default factor
         @type factor_default: str
+        @param macs2_program: MACS2 program name or path (e.g. macs2 or macs3)
+        @type macs2_program: str | None
         """
         super(ChIPSeq, self).__init__(
             configuration=configuration,
@@ -829,6 +878,11 @@ class ChIPSeq(Analysis):
         self.transcriptome_gtf_path = transcriptome_gtf_path
         self.transcriptome_txdb_path = transcriptome_txdb_path
 
+        if macs2_program is None:
+            self.macs2_program = 'macs2'
+        else:
+            self.macs2_program = macs2_program
+
         self._comparison_dict = dict()
         """ @type _comparison_dict: dict[str, dict[str, ChIPSeqComparison]] """
 
@@ -906,6 +960,10 @@ class ChIPSeq(Analysis):
         if configuration.config_parser.has_option(section=section, option=option):
             self.factor_default = configuration.config_parser.get(section=section, option=option)
 
+        option = 'macs2_program'
+        if configuration.config_parser.has_option(section=section, option=option):
+            self.macs2_program = configuration.config_parser.get(section=section, option=option)
+
         return
 
     def get_colour(self, factor):
@@ -921,6 +979,30 @@ class ChIPSeq(Analysis):
         else:
             return self.colour_default
 
+    def get_unique_comparisons(self):
+        """Get unique C{bsf.analyses.chipseq.ChIPSeqComparison} objects.
+
+        Since a particular peak calling pair may exist in more than one comparison group,
+        only the first occurrence in sorted comparison name and pair order is returned.
+        @return: Python C{list} of unique C{bsf.analyses.chipseq.ChIPSeqComparison} objects
+        @rtype: list[ChIPSeqComparison]
+        """
+        chipseq_comparison_list = list()
+        """ @type chipseq_comparison_list: list[ChIPSeqComparison] """
+
+        chipseq_comparison_key_set = set()
+        """ @type chipseq_comparison_key_set: set[str] """
+
+        for comparison_name in sorted(self._comparison_dict):
+            for comparison_pair in sorted(self._comparison_dict[comparison_name]):
+                chipseq_comparison = self._comparison_dict[comparison_name][comparison_pair]
+                chipseq_comparison_key = chipseq_comparison.get_key()
+                if chipseq_comparison_key not in chipseq_comparison_key_set:
+                    chipseq_comparison_key_set.add(chipseq_comparison_key)
+                    chipseq_comparison_list.append(chipseq_comparison)
+
+        return chipseq_comparison_list
+
     def run(self):
         """Run a C{bsf.analyses.chipseq.ChIPSeq} C{bsf.analysis.Analysis}.
         """
@@ -945,12 +1027,7 @@ class ChIPSeq(Analysis):
             """
             annotation_sheet = AnnotationSheet.from_file_path(file_path=self.comparison_path)
 
-            # Unfortunately, two passes through the comparison sheet are required.
-            # In the first one merge all Sample objects that share the name.
-            # Merging Sample objects is currently the only way to pool PairedReads objects,
-            # which is required for ChIP-Seq experiments.
-
-            # Second pass, add all Sample objects mentioned in a comparison.
+            # A single pass through the comparison sheet adds all Sample objects mentioned in a comparison.
 
             for row_dict in annotation_sheet.row_dicts:
                 if 'Name' in row_dict and row_dict['Name']:
@@ -1048,24 +1125,18 @@ class ChIPSeq(Analysis):
 
                 self._comparison_dict[comparison_name][comparison_pair] = comparison
 
-            # Sort the comparison keys alphabetically and assign DiffBind replicate numbers
-            # into ChIPSeqComparison objects.
+            # For each comparison name, sort the DiffBind ChIPSeqComparison objects by comparison group and
+            # ChIPSeqComparison.get_key(), then number them as DiffBind replicates within each comparison group.
 
             for comparison_dict in self._comparison_dict.values():
-                # Rearrange by comparison group and comparison key.
-                comparison_group_dict = dict()
-                """ @type comparison_group_dict: dict[str, list[ChIPSeqComparison]] """
-                for comparison in comparison_dict.values():
-                    if not comparison.diff_bind:
-                        continue
-                    if comparison.group not in comparison_group_dict:
-                        comparison_group_dict[comparison.group] = list()
-                    comparison_group_dict[comparison.group].append(comparison)
+                comparison_list = sorted(
+                    (comparison for comparison in comparison_dict.values() if comparison.diff_bind),
+                    key=lambda item: (item.group, item.get_key()))
+                """ @type comparison_list: list[ChIPSeqComparison] """
 
-                # For each group, order by ChIPSeqComparison.get_key() and assign DiffBind replicate numbers.
-                for comparison_list in comparison_group_dict.values():
-                    for replicate, comparison in enumerate(sorted(comparison_list, key=lambda item: item.get_key())):
-                        comparison.replicate = replicate + 1
+                for _, comparison_iterator in itertools.groupby(comparison_list, key=lambda item: item.group):
+                    for replicate, comparison in enumerate(comparison_iterator, start=1):
+                        comparison.replicate = replicate
 
             return
 
@@ -1151,360 +1222,289 @@ class ChIPSeq(Analysis):
         def run_create_macs1_jobs():
             """Create MACS1 peak caller jobs.
             """
-            chipseq_comparison_key_list = list()
-            """ @type chipseq_comparison_key_list: list[str] """
-
-            for comparison_name in sorted(self._comparison_dict):
-                for comparison_pair in sorted(self._comparison_dict[comparison_name]):
-                    chipseq_comparison = self._comparison_dict[comparison_name][comparison_pair]
-                    # Since a particular peak calling pair may exists in more than one comparison group,
-                    # make sure only unique pairs get submitted.
-                    if chipseq_comparison.get_key() in chipseq_comparison_key_list:
-                        continue
-                    else:
-                        chipseq_comparison_key_list.append(chipseq_comparison.get_key())
+            for chipseq_comparison in self.get_unique_comparisons():
+                factor = chipseq_comparison.factor.upper()
 
-                    factor = chipseq_comparison.factor.upper()
+                t_file_path_list = list()
+                for t_sample in chipseq_comparison.t_samples:
+                    t_file_path_list.append(self.get_file_path_alignment(sample_name=t_sample.name).sample_bam)
 
-                    t_file_path_list = list()
-                    for t_sample in chipseq_comparison.t_samples:
-                        t_file_path_list.append(self.get_file_path_alignment(sample_name=t_sample.name).sample_bam)
-
-                    c_file_path_list = list()
-                    for c_sample in chipseq_comparison.c_samples:
-                        c_file_path_list.append(self.get_file_path_alignment(sample_name=c_sample.name).sample_bam)
-
-                    prefix_peak_calling = chipseq_comparison.get_prefix_peak_calling()
+                c_file_path_list = list()
+                for c_sample in chipseq_comparison.c_samples:
+                    c_file_path_list.append(self.get_file_path_alignment(sample_name=c_sample.name).sample_bam)
 
-                    file_path_peak_calling = FilePathPeakCalling(prefix=prefix_peak_calling)
-
-                    runnable_peak_calling = self.add_runnable_consecutive(
-                        runnable=ConsecutiveRunnable(
-                            name=prefix_peak_calling,
-                            working_directory=self.genome_directory,
-                            debug=self.debug))
-                    executable_peak_calling = self.set_stage_runnable(
-                        stage=stage_peak_calling,
-                        runnable=runnable_peak_calling)
+                prefix_peak_calling = chipseq_comparison.get_prefix_peak_calling()
 
-                    # Add a RunnableStep to create the output directory.
+                file_path_peak_calling = FilePathPeakCalling(prefix=prefix_peak_calling)
 
-                    runnable_step = RunnableStepMakeDirectory(
-                        name='make_directory',
-                        directory_path=file_path_peak_calling.output_directory)
-                    runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+                runnable_peak_calling = self.add_runnable_consecutive(
+                    runnable=ConsecutiveRunnable(
+                        name=prefix_peak_calling,
+                        working_directory=self.genome_directory,
+                        debug=self.debug))
+                executable_peak_calling = self.set_stage_runnable(
+                    stage=stage_peak_calling,
+                    runnable=runnable_peak_calling)
 
-                    # Add a RunnableStep for MACS14 call peak.
+                # Add a RunnableStep to create the output directory.
 
-                    runnable_step = RunnableStep(
-                        name='macs14_call_peak',
-                        program='macs14',
-                        sub_command=Command(program='callpeak'))
-                    runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+                runnable_step = RunnableStepMakeDirectory(
+                    name='make_directory',
+                    directory_path=file_path_peak_calling.output_directory)
+                runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
 
-                    # Read RunnableStep options from configuration sections:
-                    # [bsf.analyses.chipseq.ChIPSeq.macs14_call_peak]
-                    # [bsf.analyses.chipseq.ChIPSeq.macs14_call_peak.callpeak]
-                    self.set_runnable_step_configuration(runnable_step=runnable_step)
+                # Add a RunnableStep for MACS14 call peak.
 
+                runnable_step = RunnableStep(
+                    name='macs14_call_peak',
+                    program='macs14',
+                    sub_command=Command(program='callpeak'))
+                runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+
+                # Read RunnableStep options from configuration sections:
+                # [bsf.analyses.chipseq.ChIPSeq.macs14_call_peak]
+                # [bsf.analyses.chipseq.ChIPSeq.macs14_call_peak.callpeak]
+                self.set_runnable_step_configuration(runnable_step=runnable_step)
+
+                runnable_step.add_option_multi_long(
+                    key='treatment',
+                    value=' '.join(t_file_path_list))
+
+                if c_file_path_list:
+                    # Control (input) samples are optional.
                     runnable_step.add_option_multi_long(
-                        key='treatment',
-                        value=' '.join(t_file_path_list))
-
-                    if c_file_path_list:
-                        # Control (input) samples are optional.
-                        runnable_step.add_option_multi_long(
-                            key='control',
-                            value=' '.join(c_file_path_list))
-
-                    # MACS14 can hopefully also cope with directories specified in the --name option, but
-                    # the resulting R script has them set too. Hence the R script has to be started
-                    # from the genome_directory. However, the R script needs re-writing anyway, because
-                    # it would be better to use the PNG rather than the PDF device for plotting.
-                    runnable_step.sub_command.add_option_long(
-                        key='name',
-                        value=file_path_peak_calling.name_prefix)
-
-                    # The 'gsize' option has to be specified via the configuration.ini file in section
-                    # [bsf.analyses.chipseq.ChIPSeq.macs14_call_peak.callpeak].
-                    runnable_step.add_switch_long(key='single-profile')
-                    runnable_step.add_switch_long(key='call-subpeaks')
-                    runnable_step.add_switch_long(key='wig')
-
-                    if factor == 'H3K4ME1':
-                        pass
-                    elif factor == 'H3K4ME2':
-                        pass
-                    elif factor == 'H3K4ME3':
-                        pass  # Default settings from above.
-                    elif factor == 'H3K9AC':
-                        pass
-                    elif factor == 'H3K9ME3':
-                        pass
-                    elif factor == 'H3K27AC':
-                        pass
-                    elif factor == 'H3K27ME1':
-                        pass
-                    elif factor == 'H3K27ME2':
-                        pass
-                    elif factor == 'H3K27ME3':
-                        pass
-                    elif factor == 'H3K36ME3':
-                        # Parameter setting for H3K36me3 according to Nature Protocols (2012)
-                        # Vol.7 No.9 1728-1740 doi:10.1038/nprot.2012.101 Protocol (D)
-                        runnable_step.add_switch_long(key='nomodel')
-                        runnable_step.add_option_long(key='shiftsize', value='73')
-                        runnable_step.add_option_long(key='pvalue', value='1e-3')
-                    elif factor == 'H3K56AC':
-                        pass
-                    elif factor == 'H4K16AC':
-                        pass
-                    elif factor == 'OTHER':
-                        pass
-                    else:
-                        warnings.warn(
-                            'Unable to set MACS14 parameters for unknown factor ' + repr(factor) + '.\n' +
-                            'Please use default factor ' + repr(self.factor_default) +
-                            ' or adjust Python code if necessary.',
-                            UserWarning)
-
-                    # Add a RunnableStep to process MACS14 output.
+                        key='control',
+                        value=' '.join(c_file_path_list))
+
+                # MACS14 can hopefully also cope with directories specified in the --name option, but
+                # the resulting R script has them set too. Hence the R script has to be started
+                # from the genome_directory. However, the R script needs re-writing anyway, because
+                # it would be better to use the PNG rather than the PDF device for plotting.
+                runnable_step.sub_command.add_option_long(
+                    key='name',
+                    value=file_path_peak_calling.name_prefix)
+
+                # The 'gsize' option has to be specified via the configuration.ini file in section
+                # [bsf.analyses.chipseq.ChIPSeq.macs14_call_peak.callpeak].
+                runnable_step.add_switch_long(key='single-profile')
+                runnable_step.add_switch_long(key='call-subpeaks')
+                runnable_step.add_switch_long(key='wig')
+
+                if factor == 'H3K36ME3':
+                    # Parameter setting for H3K36me3 according to Nature Protocols (2012)
+                    # Vol.7 No.9 1728-1740 doi:10.1038/nprot.2012.101 Protocol (D)
+                    runnable_step.add_switch_long(key='nomodel')
+                    runnable_step.add_option_long(key='shiftsize', value='73')
+                    runnable_step.add_option_long(key='pvalue', value='1e-3')
+                elif factor not in self.factor_names:
+                    warnings.warn(
+                        'Unable to set MACS14 parameters for unknown factor ' + repr(factor) + '.\n' +
+                        'Please use default factor ' + repr(self.factor_default) +
+                        ' or adjust Python code if necessary.',
+                        UserWarning)
+
+                # Add a RunnableStep to process MACS14 output.
 
-                    runnable_step = RunnableStep(
-                        name='process_macs14',
-                        program='bsf_chipseq_process_macs14.bash')
-                    runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+                runnable_step = RunnableStep(
+                    name='process_macs14',
+                    program='bsf_chipseq_process_macs14.bash')
+                runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
 
-                    # Specify the output path as in the macs14 --name option.
-                    runnable_step.arguments.append(prefix_peak_calling)
-                    runnable_step.arguments.append(self.genome_sizes_path)
+                # Specify the output path as in the macs14 --name option.
+                runnable_step.arguments.append(prefix_peak_calling)
+                runnable_step.arguments.append(self.genome_sizes_path)
 
-                    if os.path.exists(os.path.join(self.genome_directory, file_path_peak_calling.summits_bb)):
-                        executable_peak_calling.submit = False
+                if os.path.exists(os.path.join(self.genome_directory, file_path_peak_calling.summits_bb)):
+                    executable_peak_calling.submit = False
 
             return
 
         def run_create_macs2_jobs():
             """Create MACS2 peak caller jobs.
             """
-            chipseq_comparison_key_list = list()
-            """ @type chipseq_comparison_key_list: list[str] """
-
-            for comparison_name in sorted(self._comparison_dict):
-                for comparison_pair in sorted(self._comparison_dict[comparison_name]):
-                    chipseq_comparison = self._comparison_dict[comparison_name][comparison_pair]
-                    # Since a particular peak calling pair may exists in more than one comparison group,
-                    # make sure only unique pairs get submitted.
-                    if chipseq_comparison.get_key() in chipseq_comparison_key_list:
-                        continue
-                    else:
-                        chipseq_comparison_key_list.append(chipseq_comparison.get_key())
-
-                    factor = chipseq_comparison.factor.upper()
-                    prefix_peak_calling = chipseq_comparison.get_prefix_peak_calling()
+            for chipseq_comparison in self.get_unique_comparisons():
+                factor = chipseq_comparison.factor.upper()
+                prefix_peak_calling = chipseq_comparison.get_prefix_peak_calling()
 
-                    file_path_peak_calling = chipseq_comparison.get_file_path_peak_calling()
+                file_path_peak_calling = chipseq_comparison.get_file_path_peak_calling()
 
-                    runnable_peak_calling = self.add_runnable_consecutive(
-                        runnable=ConsecutiveRunnable(
-                            name=prefix_peak_calling,
-                            working_directory=self.genome_directory,
-                            debug=self.debug))
-                    executable_peak_calling = self.set_stage_runnable(
-                        stage=stage_peak_calling,
-                        runnable=runnable_peak_calling)
-
-                    t_file_path_list = list()
-                    for t_sample in chipseq_comparison.t_samples:
-                        t_file_path_list.append(self.get_file_path_alignment(sample_name=t_sample.name).sample_bam)
-                        executable_peak_calling.dependencies.append(
-                            self.get_prefix_alignment(sample_name=t_sample.name))
+                runnable_peak_calling = self.add_runnable_consecutive(
+                    runnable=ConsecutiveRunnable(
+                        name=prefix_peak_calling,
+                        working_directory=self.genome_directory,
+                        debug=self.debug))
+                executable_peak_calling = self.set_stage_runnable(
+                    stage=stage_peak_calling,
+                    runnable=runnable_peak_calling)
 
-                    c_file_path_list = list()
-                    for c_sample in chipseq_comparison.c_samples:
-                        c_file_path_list.append(self.get_file_path_alignment(sample_name=c_sample.name).sample_bam)
-                        executable_peak_calling.dependencies.append(
-                            self.get_prefix_alignment(sample_name=c_sample.name))
+                t_file_path_list = [
+                    self.get_file_path_alignment(sample_name=t_sample.name).sample_bam
+                    for t_sample in chipseq_comparison.t_samples]
 
-                    # Add a RunnableStep to create the output directory.
+                c_file_path_list = [
+                    self.get_file_path_alignment(sample_name=c_sample.name).sample_bam
+                    for c_sample in chipseq_comparison.c_samples]
 
-                    runnable_step = RunnableStepMakeDirectory(
-                        name='make_directory',
-                        directory_path=file_path_peak_calling.output_directory)
-                    runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+                # The peak calling depends on all treatment and control alignments.
+                executable_peak_calling.dependencies.extend(
+                    [self.get_prefix_alignment(sample_name=sample.name)
+                     for sample in chipseq_comparison.t_samples + chipseq_comparison.c_samples])
 
-                    # Add a RunnableStep for MACS2 call peak.
+                # Add a RunnableStep to create the output directory.
 
-                    runnable_step = RunnableStep(
-                        name='macs2_call_peak',
-                        program='macs2',
-                        sub_command=Command(program='callpeak'))
-                    runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+                runnable_step = RunnableStepMakeDirectory(
+                    name='make_directory',
+                    directory_path=file_path_peak_calling.output_directory)
+                runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
 
-                    # Read RunnableStep options from configuration sections:
-                    # [bsf.analyses.chipseq.ChIPSeq.macs2_call_peak]
-                    # [bsf.analyses.chipseq.ChIPSeq.macs2_call_peak.callpeak]
-                    self.set_runnable_step_configuration(runnable_step=runnable_step)
+                # Add a RunnableStep for MACS2 call peak.
 
+                runnable_step = RunnableStep(
+                    name='macs2_call_peak',
+                    program=self.macs2_program,
+                    sub_command=Command(program='callpeak'))
+                runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+
+                # Read RunnableStep options from configuration sections:
+                # [bsf.analyses.chipseq.ChIPSeq.macs2_call_peak]
+                # [bsf.analyses.chipseq.ChIPSeq.macs2_call_peak.callpeak]
+                self.set_runnable_step_configuration(runnable_step=runnable_step)
+
+                runnable_step.sub_command.add_option_multi_long(
+                    key='treatment',
+                    value=' '.join(t_file_path_list))
+
+                if c_file_path_list:
+                    # The control (input) samples are optional.
                     runnable_step.sub_command.add_option_multi_long(
-                        key='treatment',
-                        value=' '.join(t_file_path_list))
-
-                    if c_file_path_list:
-                        # The control (input) samples are optional.
-                        runnable_step.sub_command.add_option_multi_long(
-                            key='control',
-                            value=' '.join(c_file_path_list))
-                    # --format ["AUTO"]
-                    # --gsize ["hs"] Genome size
-                    # The 'gsize' option has to be specified via the configuration.ini file in section
-                    # [bsf.analyses.chipseq.ChIPSeq.macs2_call_peak.callpeak].
-                    # --tsize [null] Tag size or read length
-                    # --keep-dup [1]
-
-                    # Output arguments
-                    # --outdir [.]
-                    # --name ["NA"]
-                    # MACS2 can cope with directories specified in the --name option, but
-                    # the resulting R script has them set too. Hence the R script has to be started
-                    # from the genome_directory. However, the R script needs re-writing anyway, because
-                    # it would be better to use the PNG rather than the PDF device for plotting.
-                    runnable_step.sub_command.add_option_long(
-                        key='name',
-                        value=file_path_peak_calling.name_prefix)
-
-                    # --bdg [False]
-                    runnable_step.sub_command.add_switch_long(key='bdg')
-                    # --verbose [2]
-                    # --trackline [False]
-                    # --SPMR [False]
-                    runnable_step.sub_command.add_switch_long(key='SPMR')
-
-                    # Shifting model arguments
-                    # --nomodel [False]
-                    # --shift [0]
-                    # --extsize [200]
-                    # --bw [300]
-                    # --mfold [5 50]
-                    # --fix-bimodal [False]
-
-                    # Peak calling arguments
-                    # --qvalue [0.05]
-                    # --pvalue [null]
-                    # --scale-to ["small"]
-                    # --ratio [ignore]
-                    # --down-sample [False]
-                    # --seed [null]
+                        key='control',
+                        value=' '.join(c_file_path_list))
+                # --format ["AUTO"]
+                # --gsize ["hs"] Genome size
+                # The 'gsize' option has to be specified via the configuration.ini file in section
+                # [bsf.analyses.chipseq.ChIPSeq.macs2_call_peak.callpeak].
+                # --tsize [null] Tag size or read length
+                # --keep-dup [1]
+
+                # Output arguments
+                # --outdir [.]
+                # --name ["NA"]
+                # MACS2 can cope with directories specified in the --name option, but
+                # the resulting R script has them set too. Hence the R script has to be started
+                # from the genome_directory. However, the R script needs re-writing anyway, because
+                # it would be better to use the PNG rather than the PDF device for plotting.
+                runnable_step.sub_command.add_option_long(
+                    key='name',
+                    value=file_path_peak_calling.name_prefix)
+
+                # --bdg [False]
+                runnable_step.sub_command.add_switch_long(key='bdg')
+                # --verbose [2]
+                # --trackline [False]
+                # --SPMR [False]
+                runnable_step.sub_command.add_switch_long(key='SPMR')
+
+                # Shifting model arguments
+                # --nomodel [False]
+                # --shift [0]
+                # --extsize [200]
+                # --bw [300]
+                # --mfold [5 50]
+                # --fix-bimodal [False]
+
+                # Peak calling arguments
+                # --qvalue [0.05]
+                # --pvalue [null]
+                # --scale-to ["small"]
+                # --ratio [ignore]
+                # --down-sample [False]
+                # --seed [null]
+                runnable_step.sub_command.add_option_long(
+                    key='tempdir',
+                    value=runnable_peak_calling.temporary_directory_path(absolute=False))
+                # --nolambda [null]
+                # --slocal [1000]
+                # --llocal [10000]
+                # --max-gap [null]
+                # --min-length [null]
+                # --broad [False]
+                # --broad-cutoff [0.1]
+                # --cutoff-analysis [False]
+
+                # Post-processing options
+                # --call-summits [False]
+                # --fe-cutoff [1.0]
+
+                # Other options
+                # --buffer-size [100000]
+
+                if factor == 'H3K36ME3':
+                    # Parameter setting for H3K36me3 according to Nature Protocols (2012)
+                    # Vol.7 No.9 1728-1740 doi:10.1038/nprot.2012.101 Protocol (D)
+                    runnable_step.sub_command.add_switch_long(key='nomodel')
+                    # The shiftsize option is no longer supported in MACS 2.1.0
+                    # runnable_step.add_option_long(key='shiftsize', value='73')
                     runnable_step.sub_command.add_option_long(
-                        key='tempdir',
-                        value=runnable_peak_calling.temporary_directory_path(absolute=False))
-                    # --nolambda [null]
-                    # --slocal [1000]
-                    # --llocal [10000]
-                    # --max-gap [null]
-                    # --min-length [null]
-                    # --broad [False]
-                    # --broad-cutoff [0.1]
-                    # --cutoff-analysis [False]
-
-                    # Post-processing options
-                    # --call-summits [False]
-                    # --fe-cutoff [1.0]
-
-                    # Other options
-                    # --buffer-size [100000]
-
-                    if factor == 'H3K4ME1':
-                        pass
-                    elif factor == 'H3K4ME2':
-                        pass
-                    elif factor == 'H3K4ME3':
-                        pass  # Default settings from above.
-                    elif factor == 'H3K9AC':
-                        pass
-                    elif factor == 'H3K9ME3':
-                        pass
-                    elif factor == 'H3K27AC':
-                        pass
-                    elif factor == 'H3K27ME1':
-                        pass
-                    elif factor == 'H3K27ME2':
-                        pass
-                    elif factor == 'H3K27ME3':
-                        pass
-                    elif factor == 'H3K36ME3':
-                        # Parameter setting for H3K36me3 according to Nature Protocols (2012)
-                        # Vol.7 No.9 1728-1740 doi:10.1038/nprot.2012.101 Protocol (D)
-                        runnable_step.sub_command.add_switch_long(key='nomodel')
-                        # The shiftsize option is no longer supported in MACS 2.1.0
-                        # runnable_step.add_option_long(key='shiftsize', value='73')
-                        runnable_step.sub_command.add_option_long(
-                            key='pvalue',
-                            value='1e-3')
-                    elif factor == 'H3K56AC':
-                        pass
-                    elif factor == 'H4K16AC':
-                        pass
-                    elif factor == 'OTHER':
-                        pass
-                    else:
-                        warnings.warn(
-                            'Unable to set MACS2 parameters for unknown factor ' + repr(factor) + '.\n' +
-                            'Please use default factor ' + repr(self.factor_default) +
-                            ' or adjust Python code if necessary.',
-                            UserWarning)
-
-                    # Add a RunnableStep to compare bedGraph files.
-
-                    runnable_step = RunnableStep(
-                        name='macs2_bdg_cmp',
-                        program='macs2',
-                        sub_command=Command(program='bdgcmp'))
-                    runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
-
-                    # Read RunnableStep options from configuration sections:
-                    # [bsf.analyses.chipseq.ChIPSeq.macs2_bdg_cmp]
-                    # [bsf.analyses.chipseq.ChIPSeq.macs2_bdg_cmp.bdgcmp]
-                    self.set_runnable_step_configuration(runnable_step=runnable_step)
-
-                    # --tfile
-                    runnable_step.sub_command.add_option_long(
-                        key='tfile',
-                        value=file_path_peak_calling.treatment_bdg)
-
-                    # --cfile
-                    runnable_step.sub_command.add_option_long(
-                        key='cfile',
-                        value=file_path_peak_calling.control_bdg)
-
-                    # --scaling-factor [1.0]
-                    # --pseudocount [0.0]
-                    runnable_step.sub_command.add_option_long(key='pseudocount', value='0.00001')
-
-                    # --method [ppois] i.e. Poisson Pvalue -log10(pvalue), which yields data on a logarithmic scale
-                    runnable_step.sub_command.add_option_multi_long(
-                        key='method',
-                        value='ppois subtract logFE')
+                        key='pvalue',
+                        value='1e-3')
+                elif factor not in self.factor_names:
+                    warnings.warn(
+                        'Unable to set MACS2 parameters for unknown factor ' + repr(factor) + '.\n' +
+                        'Please use default factor ' + repr(self.factor_default) +
+                        ' or adjust Python code if necessary.',
+                        UserWarning)
 
-                    # --outdir [.]
-                    # --o-prefix [null]
-                    runnable_step.sub_command.add_option_long(
-                        key='o-prefix',
-                        value=file_path_peak_calling.name_prefix)
-                    # --ofile
+                # Add a RunnableStep to compare bedGraph files.
 
-                    # Add a RunnableStep to process MACS2 output.
+                runnable_step = RunnableStep(
+                    name='macs2_bdg_cmp',
+                    program=self.macs2_program,
+                    sub_command=Command(program='bdgcmp'))
+                runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+
+                # Read RunnableStep options from configuration sections:
+                # [bsf.analyses.chipseq.ChIPSeq.macs2_bdg_cmp]
+                # [bsf.analyses.chipseq.ChIPSeq.macs2_bdg_cmp.bdgcmp]
+                self.set_runnable_step_configuration(runnable_step=runnable_step)
+
+                # --tfile
+                runnable_step.sub_command.add_option_long(
+                    key='tfile',
+                    value=file_path_peak_calling.treatment_bdg)
+
+                # --cfile
+                runnable_step.sub_command.add_option_long(
+                    key='cfile',
+                    value=file_path_peak_calling.control_bdg)
+
+                # --scaling-factor [1.0]
+                # --pseudocount [0.0]
+                runnable_step.sub_command.add_option_long(key='pseudocount', value='0.00001')
+
+                # --method [ppois] i.e. Poisson Pvalue -log10(pvalue), which yields data on a logarithmic scale
+                runnable_step.sub_command.add_option_multi_long(
+                    key='method',
+                    value='ppois subtract logFE')
+
+                # --outdir [.]
+                # --o-prefix [null]
+                runnable_step.sub_command.add_option_long(
+                    key='o-prefix',
+                    value=file_path_peak_calling.name_prefix)
+                # --ofile
+
+                # Add a RunnableStep to process MACS2 output.
 
-                    runnable_step = RunnableStep(
-                        name='process_macs2',
-                        program='bsf_chipseq_process_macs2.bash')
-                    runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
+                runnable_step = RunnableStep(
+                    name='process_macs2',
+                    program='bsf_chipseq_process_macs2.bash')
+                runnable_peak_calling.add_runnable_step(runnable_step=runnable_step)
 
-                    runnable_step.arguments.append(prefix_peak_calling)
-                    runnable_step.arguments.append(self.genome_sizes_path)
+                runnable_step.arguments.append(prefix_peak_calling)
+                runnable_step.arguments.append(self.genome_sizes_path)
 
-                    if os.path.exists(os.path.join(self.genome_directory, file_path_peak_calling.narrow_peaks_bb)):
-                        executable_peak_calling.submit = False
+                if os.path.exists(os.path.join(self.genome_directory, file_path_peak_calling.narrow_peaks_bb)):
+                    executable_peak_calling.submit = False
 
             return
 
@@ -1560,15 +1560,15 @@ class ChIPSeq(Analysis):
                         if not chipseq_comparison.diff_bind:
                             continue
 
-                        t_file_path_list = list()
-                        for t_sample in chipseq_comparison.t_samples:
-                            t_file_path_list.append(self.get_file_path_alignment(sample_name=t_sample.name).sample_bam)
+                        # The DiffBind sample sheet takes only the first treatment and control BAM file.
+                        t_sample_bam = self.get_file_path_alignment(
+                            sample_name=chipseq_comparison.t_samples[0].name).sample_bam
 
-                        c_file_path_list = list()
-                        for c_sample in chipseq_comparison.c_samples:
-                            c_file_path_list.append(self.get_file_path_alignment(sample_name=c_sample.name).sample_bam)
+                        if chipseq_comparison.c_samples:
+                            c_sample_bam = self.get_file_path_alignment(
+                                sample_name=chipseq_comparison.c_samples[0].name).sample_bam
                         else:
-                            c_file_path_list.append('')
+                            c_sample_bam = str()
 
                         file_path_peak_calling = chipseq_comparison.get_file_path_peak_calling()
 
@@ -1581,8 +1581,8 @@ class ChIPSeq(Analysis):
                             'Condition': chipseq_comparison.condition,
                             'Treatment': chipseq_comparison.treatment,
                             'Replicate': str(chipseq_comparison.replicate),
-                            'bamReads': t_file_path_list[0],
-                            'bamControl': c_file_path_list[0],
+                            'bamReads': t_sample_bam,
+                            'bamControl': c_sample_bam,
                             'ControlID': chipseq_comparison.c_name,
                             'Peaks': file_path_peak_calling.peaks_xls,
                             'PeakCaller': 'macs',
@@ -1817,52 +1817,47 @@ class ChIPSeq(Analysis):
             for comparison_name in sorted(self._comparison_dict):
                 for comparison_pair in sorted(self._comparison_dict[comparison_name]):
                     chipseq_comparison = self._comparison_dict[comparison_name][comparison_pair]
-                    t_file_path_list = list()
-                    for t_sample in chipseq_comparison.t_samples:
-                        t_file_path_list.append(self.get_file_path_alignment(sample_name=t_sample.name).sample_bam)
 
-                    c_file_path_list = list()
+                    # Get the sorted control PairedReads names once per comparison, rather than per treatment.
+                    c_paired_reads_name_list = list()
+                    """ @type c_paired_reads_name_list: list[str] """
                     for c_sample in chipseq_comparison.c_samples:
-                        c_file_path_list.append(self.get_file_path_alignment(sample_name=c_sample.name).sample_bam)
-                    else:
-                        c_file_path_list.append('')
+                        c_paired_reads_name_list.extend(
+                            sorted(c_sample.get_all_paired_reads(replicate_grouping=self.replicate_grouping)))
 
                     for t_sample in chipseq_comparison.t_samples:
                         t_paired_reads_dict = t_sample.get_all_paired_reads(
                             replicate_grouping=self.replicate_grouping)
                         for t_paired_reads_name in sorted(t_paired_reads_dict):
-                            for c_sample in chipseq_comparison.c_samples:
-                                c_paired_reads_dict = c_sample.get_all_paired_reads(
-                                    replicate_grouping=self.replicate_grouping)
-                                for c_paired_reads_name in sorted(c_paired_reads_dict):
-                                    str_list.append('<tr>\n')
-                                    # Comparison name
-                                    str_list.append('<td>' + comparison_name + '</td>\n')
-                                    # Peaks
-                                    str_list.append('<td>')
-                                    str_list.append('<a href="' + t_paired_reads_name + '__' + c_paired_reads_name +
-                                                    '_peaks.xls">')
-                                    str_list.append('Peaks ' + t_paired_reads_name + ' versus ' + c_paired_reads_name)
-                                    str_list.append('</a>')
-                                    str_list.append('</td>\n')
-                                    # Negative Peaks
-                                    str_list.append('<td>')
-                                    str_list.append('<a href="' + t_paired_reads_name + '__' + c_paired_reads_name +
-                                                    '_negative_peaks.xls">')
-                                    str_list.append('Negative peaks ' + t_paired_reads_name + ' versus ' +
-                                                    c_paired_reads_name)
-                                    str_list.append('</a>')
-                                    str_list.append('</td>\n')
-                                    # R Model
-                                    str_list.append('<td>')
-                                    str_list.append('<a href="' + t_paired_reads_name + '__' + c_paired_reads_name +
-                                                    '_model.r">')
-                                    str_list.append('R model')
-                                    str_list.append('</a>')
-                                    str_list.append('</td>\n')
-
-                                    str_list.append('</tr>\n')
-                                    str_list.append('\n')
+                            for c_paired_reads_name in c_paired_reads_name_list:
+                                str_list.append('<tr>\n')
+                                # Comparison name
+                                str_list.append('<td>' + comparison_name + '</td>\n')
+                                # Peaks
+                                str_list.append('<td>')
+                                str_list.append('<a href="' + t_paired_reads_name + '__' + c_paired_reads_name +
+                                                '_peaks.xls">')
+                                str_list.append('Peaks ' + t_paired_reads_name + ' versus ' + c_paired_reads_name)
+                                str_list.append('</a>')
+                                str_list.append('</td>\n')
+                                # Negative Peaks
+                                str_list.append('<td>')
+                                str_list.append('<a href="' + t_paired_reads_name + '__' + c_paired_reads_name +
+                                                '_negative_peaks.xls">')
+                                str_list.append('Negative peaks ' + t_paired_reads_name + ' versus ' +
+                                                c_paired_reads_name)
+                                str_list.append('</a>')
+                                str_list.append('</td>\n')
+                                # R Model
+                                str_list.append('<td>')
+                                str_list.append('<a href="' + t_paired_reads_name + '__' + c_paired_reads_name +
+                                                '_model.r">')
+                                str_list.append('R model')
+                                str_list.append('</a>')
+                                str_list.append('</td>\n')
+
+                                str_list.append('</tr>\n')
+                                str_list.append('\n')
 
             str_list.append('</tbody>\n')
             str_list.append('</table>\n')
@@ -2303,89 +2298,78 @@ class ChIPSeq(Analysis):
             str_list = list()
             """ @type str_list: list[str] """
 
-            chipseq_comparison_key_list = list()
-            """ @type chipseq_comparison_key_list: list[str] """
+            for chipseq_comparison in self.get_unique_comparisons():
+                prefix = chipseq_comparison.get_prefix_peak_calling()
+                versus = chipseq_comparison.t_name + ' versus ' + chipseq_comparison.c_name
+                colour = self.get_colour(factor=chipseq_comparison.factor)
 
-            for comparison_name in sorted(self._comparison_dict):
-                for comparison_pair in sorted(self._comparison_dict[comparison_name]):
-                    chipseq_comparison = self._comparison_dict[comparison_name][comparison_pair]
-                    # Since a particular peak calling pair may exists in more than one comparison group,
-                    # make sure only unique pairs get listed in the track database definition.
-                    if chipseq_comparison.get_key() in chipseq_comparison_key_list:
-                        continue
+                # Add UCSC trackDB entries for each treatment/control and absolute/normalised pair.
+
+                for treatment in (True, False):
+                    if treatment:
+                        state = 'treat'
                     else:
-                        chipseq_comparison_key_list.append(chipseq_comparison.get_key())
+                        state = 'control'
 
-                    prefix = chipseq_comparison.get_prefix_peak_calling()
+                    for absolute in (True, False):
+                        if absolute:
+                            scaling = 'absolute'
+                        else:
+                            scaling = 'normalised'
 
-                    # Add UCSC trackDB entries for each treatment/control and absolute/normalised pair.
+                        #
+                        # Add a UCSC trackDB entry for each bigWig file
+                        #
+                        # Common settings
+                        track_name = 'ChIP_' + '_'.join((prefix, state, scaling))
+                        str_list.append('track ' + track_name + '\n')
+                        str_list.append('type bigWig\n')
+                        str_list.append('shortLabel ' + track_name + '\n')
+                        str_list.append('longLabel ' + scaling.capitalize() +
+                                        ' ChIP-Seq read counts for ' + state + ' of ' + versus + '\n')
+                        str_list.append('bigDataUrl ')
+                        str_list.append('/'.join((
+                            prefix + '_MACS_wiggle', state,
+                            '_'.join((prefix, state, 'afterfiting', 'all.bw')))) + '\n')
+                        # str_list.append('html ...\n'
+                        if treatment and not absolute:
+                            str_list.append('visibility full\n')
+                        else:
+                            str_list.append('visibility hide\n')
 
-                    for treatment in (True, False):
-                        if treatment:
-                            state = 'treat'
+                        # Common optional settings
+                        str_list.append('color ' + colour + '\n')
+
+                        # bigWig - Signal graphing track settings
+                        str_list.append('graphTypeDefault bar\n')
+                        str_list.append('maxHeightPixels 100:60:20\n')
+                        str_list.append('smoothingWindow off\n')
+                        if absolute:
+                            # Track with absolute scaling.
+                            str_list.append('autoScale on\n')
                         else:
-                            state = 'control'
-
-                        for absolute in (True, False):
-                            if absolute:
-                                scaling = 'absolute'
-                            else:
-                                scaling = 'normalised'
-
-                            #
-                            # Add a UCSC trackDB entry for each bigWig file
-                            #
-                            # Common settings
-                            str_list.append('track ChIP_' + '_'.join((prefix, state, scaling)) + '\n')
-                            str_list.append('type bigWig\n')
-                            str_list.append('shortLabel ChIP_' + '_'.join((prefix, state, scaling)) + '\n')
-                            str_list.append('longLabel ' + scaling.capitalize() +
-                                            ' ChIP-Seq read counts for ' + state + ' of ' +
-                                            chipseq_comparison.t_name + ' versus ' + chipseq_comparison.c_name + '\n')
-                            str_list.append('bigDataUrl ')
-                            str_list.append('/'.join((
-                                prefix + '_MACS_wiggle', state,
-                                '_'.join((prefix, state, 'afterfiting', 'all.bw')))) + '\n')
-                            # str_list.append('html ...\n'
-                            if treatment and not absolute:
-                                str_list.append('visibility full\n')
-                            else:
-                                str_list.append('visibility hide\n')
-
-                            # Common optional settings
-                            str_list.append('color ' + self.get_colour(factor=chipseq_comparison.factor) + '\n')
-
-                            # bigWig - Signal graphing track settings
-                            str_list.append('graphTypeDefault bar\n')
-                            str_list.append('maxHeightPixels 100:60:20\n')
-                            str_list.append('smoothingWindow off\n')
-                            if absolute:
-                                # Track with absolute scaling.
-                                str_list.append('autoScale on\n')
-                            else:
-                                # Track with relative scaling.
-                                str_list.append('autoScale off\n')
-                                str_list.append('viewLimits 0:40\n')
-
-                            str_list.append('\n')
-
-                    #
-                    # Add a UCSC trackDB entry for each bigBed peaks file
-                    #
-                    # Common settings
-                    str_list.append('track Peaks_' + prefix + '\n')
-                    str_list.append('type bigBed\n')
-                    str_list.append('shortLabel Peaks_' + prefix + '\n')
-                    str_list.append('longLabel ChIP-Seq peaks for ' +
-                                    chipseq_comparison.t_name + ' versus ' + chipseq_comparison.c_name + '\n')
-                    str_list.append('bigDataUrl ' + prefix + '_peaks.bb\n')
-                    # str_list.append('html ...\n')
-                    str_list.append('visibility pack\n')
-
-                    # Common optional settings
-                    str_list.append('color ' + self.get_colour(factor=chipseq_comparison.factor) + '\n')
+                            # Track with relative scaling.
+                            str_list.append('autoScale off\n')
+                            str_list.append('viewLimits 0:40\n')
 
-                    str_list.append('\n')
+                        str_list.append('\n')
+
+                #
+                # Add a UCSC trackDB entry for each bigBed peaks file
+                #
+                # Common settings
+                str_list.append('track Peaks_' + prefix + '\n')
+                str_list.append('type bigBed\n')
+                str_list.append('shortLabel Peaks_' + prefix + '\n')
+                str_list.append('longLabel ChIP-Seq peaks for ' + versus + '\n')
+                str_list.append('bigDataUrl ' + prefix + '_peaks.bb\n')
+                # str_list.append('html ...\n')
+                str_list.append('visibility pack\n')
+
+                # Common optional settings
+                str_list.append('color ' + colour + '\n')
+
+                str_list.append('\n')
 
             # Add UCSC trackDB entries for each Bowtie2 BAM file.
 
@@ -2672,6 +2656,7 @@ class ChIPSeq(Analysis):
                 for comparison_pair in sorted(self._comparison_dict[comparison_name]):
                     chipseq_comparison = self._comparison_dict[comparison_name][comparison_pair]
                     factor_name = chipseq_comparison.factor
+                    factor_colour = self.get_colour(factor=factor_name.upper())
                     file_path_peak_calling = chipseq_comparison.get_file_path_peak_calling()
 
                     if chipseq_comparison.c_name:
@@ -2701,7 +2686,7 @@ class ChIPSeq(Analysis):
                         str_list_3.append('  visibility full\n')
 
                         # Common optional settings
-                        str_list_3.append('  color ' + self.get_colour(factor=factor_name.upper()) + '\n')
+                        str_list_3.append('  color ' + factor_colour + '\n')
 
                         # bigWig - Signal graphing track settings
                         # ...
@@ -2727,7 +2712,7 @@ class ChIPSeq(Analysis):
                         str_list_4.append('  visibility full\n')
 
                         # Common optional settings
-                        str_list_4.append('  color ' + self.get_colour(factor=factor_name.upper()) + '\n')
+                        str_list_4.append('  color ' + factor_colour + '\n')
 
                         # bigWig - Signal graphing track settings
                         # ...
@@ -2753,7 +2738,7 @@ class ChIPSeq(Analysis):
                         str_list_5.append('  visibility full\n')
 
                         # Common optional settings
-                        str_list_5.append('  color ' + self.get_colour(factor=factor_name.upper()) + '\n')
+                        str_list_5.append('  color ' + factor_colour + '\n')
 
                         # bigWig - Signal graphing track settings
                         str_list_5.append('  alwaysZero off\n')
@@ -2794,7 +2779,7 @@ class ChIPSeq(Analysis):
                         str_list_5.append('  visibility full\n')
 
                         # Common optional settings
-                        str_list_5.append('  color ' + self.get_colour(factor=factor_name.upper()) + '\n')
+                        str_list_5.append('  color ' + factor_colour + '\n')
 
                         # bigWig - Signal graphing track settings
                         str_list_5.append('  alwaysZero off\n')
@@ -2835,7 +2820,7 @@ class ChIPSeq(Analysis):
                         str_list_5.append('  visibility full\n')
 
                         # Common optional settings
-                        str_list_5.append('  color ' + self.get_colour(factor=factor_name.upper()) + '\n')
+                        str_list_5.append('  color ' + factor_colour + '\n')
 
                         # bigWig - Signal graphing track settings
                         str_list_5.append('  alwaysZero off\n')
@@ -2875,7 +2860,7 @@ class ChIPSeq(Analysis):
                         str_list_6.append('  visibility squish\n')
 
                         # Common optional settings
-                        str_list_6.append('  color ' + self.get_colour(factor=factor_name.upper()) + '\n')
+                        str_list_6.append('  color ' + factor_colour + '\n')
 
                         # bigBed - Item or region track settings.
 
@@ -2899,7 +2884,7 @@ class ChIPSeq(Analysis):
                         str_list_7.append('  visibility squish\n')
 
                         # Common optional settings
-                        str_list_7.append('  color ' + self.get_colour(factor=factor_name.upper()) + '\n')
+                        str_list_7.append('  color ' + factor_colour + '\n')
 
                         # Composite track settings
                         str_list_7.append('  parent summits on\n')
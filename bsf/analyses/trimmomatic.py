@@ -690,9 +690,9 @@ class Trimmomatic(Analysis):
 
             # This analysis is special in that read group names carry 'P' or 'U' suffices and samples carry additional
             # read groups after trimming that do no longer correspond to the initial Runnable objects. Sigh.
-            # Transiently create a Python dict without the suffix and sort its keys (bsf.ngs.PairedReads.name).
+            # Transiently create a Python set without the suffix and sort it (bsf.ngs.PairedReads.name).
 
-            for paired_reads_name in sorted(dict(map(lambda item: (item[:-1], True), paired_reads_dict.keys()))):
+            for paired_reads_name in sorted({item[:-1] for item in paired_reads_dict}):
                 prefix_read_group = self.get_prefix_read_group(read_group_name=paired_reads_name)
 
                 # The second read may still not be there.
@@ -31,7 +31,6 @@ import os
 import pickle
 import sys
 import warnings
-import json
 from subprocess import Popen
 
 from bsf.analysis import Analysis, Stage
@@ -3830,32 +3829,32 @@ class VariantCallingGATK(Analysis):
 
                 bwa_mem.arguments.append(self.bwa_genome_db)
 
-                reads1 = list()
-                reads2 = list()
+                paired_reads_list = paired_reads_dict[paired_reads_name]
+
+                reads1 = [
+                    paired_reads.reads_1.file_path for paired_reads in paired_reads_list
+                    if paired_reads.reads_1 is not None]
+                reads2 = [
+                    paired_reads.reads_2.file_path for paired_reads in paired_reads_list
+                    if paired_reads.reads_2 is not None]
 
                 # Propagate the SAM read group information around FASTQ files if required.
                 # Please note that only the first read group can be propagated per
                 # PairedReads object.
 
-                read_group = str()
-
-                for paired_reads in paired_reads_dict[paired_reads_name]:
-                    if paired_reads.reads_1 is not None:
-                        reads1.append(paired_reads.reads_1.file_path)
-                    if paired_reads.reads_2 is not None:
-                        reads2.append(paired_reads.reads_2.file_path)
-                    if not read_group and paired_reads.read_group:
-                        read_group = paired_reads.read_group
+                read_group = next(
+                    (paired_reads.read_group for paired_reads in paired_reads_list if paired_reads.read_group),
+                    str())
 
                 if read_group:
                     bwa_mem.add_option_short(key='R', value=read_group)
 
-                if len(reads1) and not len(reads2):
+                if reads1 and not reads2:
                     bwa_mem.arguments.append(','.join(reads1))
-                elif len(reads1) and len(reads2):
+                elif reads1 and reads2:
                     bwa_mem.arguments.append(','.join(reads1))
                     bwa_mem.arguments.append(','.join(reads2))
-                elif not len(reads1) and len(reads2):
+                elif not reads1 and reads2:
                     warnings.warn('Only second reads, but no first reads have been defined.')
                 else:
                     warnings.warn('No reads have been defined.')
@@ -3879,16 +3878,10 @@ class VariantCallingGATK(Analysis):
                 pickler_path = os.path.join(
                     self.genome_directory,
                     stage_align_lane.name + '_' + paired_reads_name + '.pkl')
-                json_path = os.path.join(
-                    self.genome_directory,
-                    stage_align_lane.name + '_' + paired_reads_name + '.json')
 
                 with open(file=pickler_path, mode='wb') as pickler_file:
                     pickler = pickle.Pickler(file=pickler_file, protocol=pickle.HIGHEST_PROTOCOL)
                     pickler.dump(pickler_dict_align_lane)
-                    
-                with open(file=json_path, mode='w') as json_fh:
-                    json_fh.write(json.dumps(pickler_dict_align_lane, indent=4, sort_keys=True))
 
                 # Create a bsf_run_bwa.py job to run the pickled object.
 
@@ -3898,8 +3891,8 @@ class VariantCallingGATK(Analysis):
                         program='bsf_run_bwa.py'))
 
                 # Only submit this bsf.process.Executable if the final result file does not exist.
-                if (os.path.exists(os.path.join(self.genome_directory, file_path_alignment.aligned_md5)) and
-                        os.path.getsize(os.path.join(self.genome_directory, file_path_alignment.aligned_md5))):
+                file_path_temporary = os.path.join(self.genome_directory, file_path_alignment.aligned_md5)
+                if os.path.exists(file_path_temporary) and os.path.getsize(file_path_temporary):
                     executable_align_lane.submit = False
                 # Check also for existence of a new-style bsf.procedure.Runnable status file.
                 if os.path.exists(os.path.join(
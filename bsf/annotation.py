@@ -867,12 +867,11 @@ class AnnotationSheet(object):
         @rtype: bool | None
         """
         if key in row_dict:
-            value = row_dict[key].lower()
-            if value in self._boolean_states:
-                return self._boolean_states[value]
-            else:
+            try:
+                return self._boolean_states[row_dict[key].lower()]
+            except KeyError:
                 raise ValueError('Value ' + repr(row_dict[key]) + ' in field ' + repr(key) +
-                                 ' of AnnotationSheet ' + repr(self.name) + ' is not a boolean.')
+                                 ' of AnnotationSheet ' + repr(self.name) + ' is not a boolean.') from None
 
     def sort(self):
         """Sort a C{bsf.annotation.AnnotationSheet}.
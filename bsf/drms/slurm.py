@@ -40,6 +40,7 @@ from bsf.process import Executable, get_timestamp
 
 output_directory_name = 'bsfpython_slurm_output'
 database_file_name = 'bsfpython_slurm_jobs.db'
+sbatch_pattern = re.compile(pattern=r'Submitted batch job (\d+)')
 
 
 class ProcessSLURM(object):
@@ -753,7 +754,7 @@ def submit(stage, debug=0):
                 print('Line:', _line)
                 _thread_lock.release()
 
-            _match = re.search(pattern=r'Submitted batch job (\d+)', string=_line)
+            _match = sbatch_pattern.search(string=_line)
 
             if _match:
                 _executable.process_identifier = _match.group(1)
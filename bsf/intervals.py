@@ -45,6 +45,9 @@ class Interval(object):
     @type end: int
     """
 
+    # Interval lists can hold many thousand Interval objects, which do not need a per-instance dict.
+    __slots__ = ('name', 'start', 'end')
+
     def __init__(self, name, start, end):
         """Initialise an C{bsf.intervals.Interval} object.
 
@@ -177,12 +180,14 @@ def get_interval_tiles(interval_path=None, tile_number=None, tile_width=None, ac
         for line_str in input_file:
             if line_str.startswith('@'):
                 continue
+            # Picard interval lists have five tab-separated fields: name, start, end, strand and target name.
             field_list = line_str.strip().split('\t')
             if acgt and field_list[4] != 'ACGTmer':
                 continue
-            interval = Interval(name=field_list[0], start=int(field_list[1]), end=int(field_list[2]))
-            interval_list.append(interval)
-            total_length += len(interval)
+            start = int(field_list[1])
+            end = int(field_list[2])
+            interval_list.append(Interval(name=field_list[0], start=start, end=end))
+            total_length += end - start + 1
 
     if natural:
         # If neither width nor number was requested, return one Container with all Interval objects.
@@ -194,10 +199,12 @@ def get_interval_tiles(interval_path=None, tile_number=None, tile_width=None, ac
 
         return container_list
 
+    # Since Container sums and Interval lengths are integers, comparing them against the floor of the
+    # tile length gives the same result as comparing against the exact quotient, but without floating point.
     if tile_number is not None and tile_number > 0:
-        tile_length = float(total_length) / float(tile_number)
+        tile_length = total_length // tile_number
     elif tile_width is not None and tile_width > 0:
-        tile_length = float(tile_width)
+        tile_length = int(tile_width)
     else:
         # Do not tile at all, if neither a number of tiles nor a tile width was provided.
         # Return a list of a single Container with an empty Interval i.e. sequence region, start and end coordinates.
@@ -209,11 +216,15 @@ def get_interval_tiles(interval_path=None, tile_number=None, tile_width=None, ac
 
     if packed:
         # Pack the interval list using a First Fit Decreasing algorithm.
-        # Sort interval tuples by length in descending order.
-        for interval in sorted(interval_list, key=lambda item: len(item), reverse=True):
+        # Sort (length, interval) tuples by length in descending order, so that the length of each
+        # Interval needs calculating only once, rather than for each Container it is tried against.
+        for interval_length, interval in sorted(
+                [(len(interval), interval) for interval in interval_list],
+                key=lambda item: item[0],
+                reverse=True):
             # Try to fit the item into a bin.
             for container in container_list:
-                if container.sum + len(interval) <= tile_length:
+                if container.sum + interval_length <= tile_length:
                     container.append(interval=interval)
                     break
             else:
@@ -223,7 +234,7 @@ def get_interval_tiles(interval_path=None, tile_number=None, tile_width=None, ac
     else:
         container = Container()
         for interval in interval_list:
-            if len(container) > 0 and container.sum + len(interval) > tile_length:
+            if container.interval_list and container.sum + len(interval) > tile_length:
                 container_list.append(container)
                 container = Container()
 
@@ -46,6 +46,9 @@ class FilePath(object):
     #type temporary_directory: str
     """
 
+    # Declare slots, so that sub-classes declaring slots do not need a per-instance dict.
+    __slots__ = ('prefix',)
+
     def __init__(self, prefix):
         """Initialise a C{bsf.procedure.FilePath}.
 
@@ -453,36 +456,27 @@ class Runnable(object):
         @rtype: Exception | None
         """
         # Check the Python list of bsf.process.RunnableStep objects in reverse order to see what has completed already.
-        # If a bsf.process.RunnableStep is complete, it will be the first one on the list to become the
-        # previous bsf.process.RunnableStep.
+        # If a bsf.process.RunnableStep is complete, it becomes the previous bsf.process.RunnableStep and
+        # work resumes with the next bsf.process.RunnableStep on the list.
+
+        runnable_step_previous = None
+        runnable_step_index = 0
 
-        new_runnable_step_list = list()
-        """ @type new_runnable_step_list: list[RunnableStep] """
-        for runnable_step in reversed(runnable_step_list):
-            new_runnable_step_list.append(runnable_step)
+        for index in range(len(runnable_step_list) - 1, -1, -1):
             if os.path.exists(self.runnable_step_status_file_path(
-                    runnable_step=runnable_step,
+                    runnable_step=runnable_step_list[index],
                     success=True)):
+                runnable_step_previous = runnable_step_list[index]
+                runnable_step_index = index + 1
                 break
-        new_runnable_step_list.reverse()
 
-        # Work through the list of bsf.process.RunnableStep objects in logical order.
+        # Work through the remaining list of bsf.process.RunnableStep objects in logical order.
         # Keep track of the previous bsf.process.RunnableStep.
 
         child_return_code = 0
         runnable_step_current = None
-        runnable_step_previous = None
-
-        for runnable_step_current in new_runnable_step_list:
-            # Check for a bsf.process.RunnableStep-specific status file.
-            if os.path.exists(self.runnable_step_status_file_path(
-                    runnable_step=runnable_step_current,
-                    success=True)):
-                # If a status file exists, this RunnableStep is complete.
-                # Set it as the previous RunnableStep and continue with the next RunnableStep.
-                runnable_step_previous = runnable_step_current
-                continue
 
+        for runnable_step_current in runnable_step_list[runnable_step_index:]:
             # Do the work.
 
             child_return_code = runnable_step_current.run()
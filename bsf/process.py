@@ -643,42 +643,58 @@ class Executable(Command):
         if file_type not in ('STDOUT', 'STDERR'):
             raise Exception('The file_type has to be either STDOUT or STDERR.')
 
-        thread_lock.acquire(True)
+        # The thread lock serialises printing to the shared sys.stdout stream.
+        # Diagnostic messages are only printed, and the lock only acquired, if a debug level was set.
+
         if debug > 0:
+            thread_lock.acquire(True)
             print(get_timestamp(),
                   'Started Runner ' + repr(file_type) + ' processor in module ' + repr(__name__) + '.',
                   file=sys.stdout, flush=True)
+            thread_lock.release()
+
         output_file = None
         if file_path:
             output_file = open(file=file_path, mode='wt')
             if debug > 0:
+                thread_lock.acquire(True)
                 print(get_timestamp(), 'Opened ' + repr(file_type) + ' file ' + repr(file_path) + '.',
                       file=sys.stdout, flush=True)
+                thread_lock.release()
         elif file_type == 'STDOUT':
             output_file = sys.stdout
         elif file_type == 'STDERR':
             output_file = sys.stderr
-        thread_lock.release()
+
+        # Only the shared sys.stdout and sys.stderr streams need serialising and flushing per line,
+        # a file opened by this processor is private to it and gets flushed upon closing.
+
+        shared_output = not file_path
 
         for line_str in file_handle:
-            thread_lock.acquire(True)
+            if shared_output:
+                thread_lock.acquire(True)
             if debug > 0:
                 print(get_timestamp(), file_type + ': ' + line_str.rstrip(),
-                      file=output_file, flush=True)
+                      file=output_file, flush=shared_output)
             else:
-                print(line_str.rstrip(), file=output_file, flush=True)
-            thread_lock.release()
+                print(line_str.rstrip(), file=output_file, flush=shared_output)
+            if shared_output:
+                thread_lock.release()
 
-        thread_lock.acquire(True)
         if debug > 0:
+            thread_lock.acquire(True)
             print(get_timestamp(), 'Received EOF on ' + repr(file_type) + ' pipe.',
                   file=sys.stdout, flush=True)
+            thread_lock.release()
+
         if file_path:
             output_file.close()
             if debug > 0:
+                thread_lock.acquire(True)
                 print(get_timestamp(), 'Closed ' + repr(file_type) + ' file ' + repr(file_path) + '.',
                       file=sys.stdout, flush=True)
-        thread_lock.release()
+                thread_lock.release()
 
         return
 
@@ -926,7 +942,6 @@ class Executable(Command):
                     stdin=_map_connector(_connector=self.stdin),
                     stdout=_map_connector(_connector=self.stdout),
                     stderr=_map_connector(_connector=self.stderr),
-                    close_fds='posix' in sys.builtin_module_names,
                     shell=False,
                     text=True)
             except OSError as exception:
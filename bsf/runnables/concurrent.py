@@ -143,7 +143,6 @@ def run(runnable):
                 stdin=_map_connector(_connector=runnable_step.stdin),
                 stdout=_map_connector(_connector=runnable_step.stdout),
                 stderr=_map_connector(_connector=runnable_step.stderr),
-                close_fds=True,
                 shell=False,
                 text=True)
         except OSError as exception:
@@ -174,7 +173,7 @@ def run(runnable):
                 if connector.thread_callable is None:
                     # If a specific STDOUT callable is not defined, run bsf.process.Executable.process_stdout().
                     connector.thread = Thread(
-                        target=connector.thread_callable,
+                        target=Executable.process_stdout,
                         args=[runnable_step.sub_process.stdout, thread_lock, runnable.debug],
                         kwargs={'stdout_path': connector.file_path})
                 else:
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests for the bsf.runnables.concurrent module.
+"""
+#  Copyright 2013 - 2019 Michael K. Schuster
+#
+#  Biomedical Sequencing Facility (BSF), part of the genomics core facility
+#  of the Research Center for Molecular Medicine (CeMM) of the
+#  Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+#  This file is part of BSF Python.
+#
+#  BSF Python is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  BSF Python is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+#
+import os
+import sys
+import tempfile
+import unittest
+
+from bsf.connector import StandardOutputStream
+from bsf.procedure import ConcurrentRunnable
+from bsf.process import RunnableStep
+from bsf.runnables import concurrent
+
+
+class TestRun(unittest.TestCase):
+    """Test the C{bsf.runnables.concurrent.run} function.
+    """
+
+    def setUp(self):
+        self.current_directory = os.getcwd()
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        os.chdir(self.temporary_directory.name)
+
+        return
+
+    def tearDown(self):
+        os.chdir(self.current_directory)
+        self.temporary_directory.cleanup()
+
+        return
+
+    def test_stdout_without_callable(self):
+        """A I{STDOUT} connector without a thread callable gets processed by
+        C{bsf.process.Executable.process_stdout}.
+        """
+        runnable_step = RunnableStep(
+            name='print',
+            program=sys.executable,
+            arguments=['-c', 'print("BSF")'],
+            stdout=StandardOutputStream(file_path='print_stdout.txt'))
+
+        runnable = ConcurrentRunnable(
+            name='test',
+            working_directory=self.temporary_directory.name,
+            runnable_step_list_concurrent=[runnable_step])
+
+        concurrent.run(runnable=runnable)
+
+        with open(file='print_stdout.txt', mode='rt') as input_file:
+            self.assertEqual(input_file.read(), 'BSF\n')
+
+        self.assertTrue(os.path.exists(runnable.runnable_status_file_path(success=True)))
+
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()